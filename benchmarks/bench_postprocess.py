@@ -0,0 +1,85 @@
+"""Benchmark the post-processing dictionary with 10k entries.
+
+    python -m benchmarks.bench_postprocess [--entries 10000]    # from the repo root
+
+Reports build time, cached-load time and apply() throughput for a few text
+sizes, so the per-character cost can be checked to stay flat.
+"""
+import argparse
+import json
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from sesyaz.postprocess.replacer import Replacer, load_replacer
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+
+def _dictionary(rng: random.Random, size: int) -> dict[str, str]:
+    entries: dict[str, str] = {}
+    while len(entries) < size:
+        key = " ".join(_word(rng) for _ in range(rng.randint(1, 3)))
+        entries[key] = " ".join(_word(rng) for _ in range(rng.randint(1, 6)))
+    return entries
+
+
+def _text(rng: random.Random, keys: list[str], words: int) -> str:
+    # ~10% of the tokens are dictionary hits, the rest is filler
+    out = []
+    for _ in range(words):
+        out.append(rng.choice(keys) if rng.random() < 0.1 else _word(rng))
+    return " ".join(out)
+
+
+def _timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = _dictionary(rng, args.entries)
+    keys = list(entries)
+
+    t0 = time.perf_counter()
+    replacer = Replacer(entries)
+    build = time.perf_counter() - t0
+    print(f"entries          {len(replacer):>10}")
+    print(f"build            {build * 1000:>10.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dict_path = Path(tmp) / "dictionary.json"
+        cache_path = Path(tmp) / "dictionary.marshal"
+        dict_path.write_text(json.dumps(entries))
+        t0 = time.perf_counter()
+        load_replacer(dict_path, cache_path)
+        cold = time.perf_counter() - t0
+        warm = _timed(lambda: load_replacer(dict_path, cache_path))
+    print(f"load (no cache)  {cold * 1000:>10.1f} ms")
+    print(f"load (cached)    {warm * 1000:>10.1f} ms")
+
+    for words in (100, 1_000, 10_000, 100_000):
+        text = _text(rng, keys, words)
+        elapsed = _timed(lambda: replacer.apply(text))
+        print(
+            f"apply {words:>7} words  {elapsed * 1000:>9.2f} ms"
+            f"   {elapsed / len(text) * 1e9:>7.1f} ns/char"
+        )
+
+
+if __name__ == "__main__":
+    main()
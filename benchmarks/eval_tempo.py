@@ -0,0 +1,105 @@
+"""Evaluate tempo compression: upload time saved vs. transcript drift.
+
+    python -m benchmarks.eval_tempo clip1.wav clip2.wav \\
+        --factors 1.0 1.15 1.25 1.35 1.5 [--base-url http://127.0.0.1:8000/v1]
+
+Each clip is transcribed at every factor; drift is the word error rate of
+the compressed transcript against the uncompressed (1.0×) one, so factors
+must be ≥ 1.0. Stereo clips are downmixed to mono first. --base-url points
+the client at any OpenAI-compatible endpoint, e.g. a local stand-in server
+or local backend, so the sweep can run without touching the API. Run it
+from the repo root.
+"""
+import argparse
+import os
+import statistics
+import time
+
+import numpy as np
+import openai
+import soundfile as sf
+
+from sesyaz.audio.audio_utils import delete_temp_file, save_temp_wav
+from sesyaz.audio.tempo import compress_tempo
+from sesyaz.transcription.transcribe import transcribe_file
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (r != h))
+    return row[-1] / len(ref)
+
+
+def _api_key(args) -> str:
+    if args.api_key:
+        return args.api_key
+    if os.environ.get("OPENAI_API_KEY"):
+        return os.environ["OPENAI_API_KEY"]
+    if args.base_url:
+        return "local"  # stand-in servers usually ignore the key
+    from sesyaz.config.keyring_manager import KeyringManager
+    return KeyringManager.get_key() or ""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("clips", nargs="+", help="16 kHz mono WAV files")
+    parser.add_argument("--factors", type=float, nargs="+", default=[1.0, 1.15, 1.25, 1.35, 1.5])
+    parser.add_argument("--model", default="gpt-4o-mini-transcribe")
+    parser.add_argument("--language", default="")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--api-key", default=None)
+    args = parser.parse_args()
+
+    if min(args.factors) < 1.0:
+        parser.error("--factors must all be >= 1.0 (1.0 is the reference)")
+
+    client = openai.OpenAI(api_key=_api_key(args), base_url=args.base_url)
+    factors = sorted(set(args.factors) | {1.0})
+    rows: dict[float, dict[str, list[float]]] = {
+        f: {"saved": [], "latency": [], "wer": []} for f in factors
+    }
+
+    for clip in args.clips:
+        audio, sample_rate = sf.read(clip, dtype="int16")
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1).astype(np.int16)
+        reference = None
+        for factor in factors:
+            t0 = time.perf_counter()
+            compressed = compress_tempo(audio, sample_rate, factor)
+            compress_s = time.perf_counter() - t0
+            path = save_temp_wav(compressed, sample_rate)
+            try:
+                t0 = time.perf_counter()
+                text = transcribe_file(client, path, args.model, args.language)
+                latency = time.perf_counter() - t0
+            finally:
+                delete_temp_file(path)
+            if factor == 1.0:
+                reference = text
+            wer = word_error_rate(reference, text)
+            rows[factor]["saved"].append(1.0 - len(compressed) / len(audio))
+            rows[factor]["latency"].append(latency + compress_s)
+            rows[factor]["wer"].append(wer)
+            print(f"{clip}  {factor:>4.2f}×  {latency:6.2f}s  drift {wer:6.1%}  {text[:60]!r}")
+
+    print()
+    print(f"{'factor':>6}  {'audio saved':>11}  {'latency':>8}  {'drift (WER)':>11}")
+    for factor in factors:
+        r = rows[factor]
+        print(
+            f"{factor:>5.2f}×  {statistics.mean(r['saved']):>11.1%}"
+            f"  {statistics.mean(r['latency']):>7.2f}s  {statistics.mean(r['wer']):>11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
 import sys
-from sesyaz.app import main
+from sesyaz.cli import main
 
 sys.exit(main())
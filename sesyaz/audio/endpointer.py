@@ -0,0 +1,58 @@
+import math
+
+
+class Endpointer:
+    """Incremental end-of-speech detector fed with one RMS value per block.
+
+    Tracks an adaptive noise floor (drops quickly, rises slowly), classifies
+    each block as speech or silence with hysteresis, and reports the end of
+    speech once enough trailing silence follows enough speech. update() is
+    O(1) and allocation-free, so it can run inside the audio callback.
+    """
+
+    SPEECH_RATIO = 3.0    # enter speech above floor × 3 (~ +9.5 dB)
+    RELEASE_RATIO = 2.0   # leave speech below floor × 2
+    MIN_LEVEL = 60.0      # int16 RMS units; ignore near-digital-silence
+    FLOOR_FALL = 0.5      # EMA weight when the level drops below the floor
+    FLOOR_RISE = 0.005    # EMA weight when it rises (slow: speech must not lift it)
+    MIN_SPEECH_S = 0.25   # speech needed before an endpoint can trigger
+
+    def __init__(self, block_s: float, trailing_silence_s: float = 1.5):
+        self._min_speech = max(1, math.ceil(self.MIN_SPEECH_S / block_s))
+        self._max_silence = max(1, math.ceil(trailing_silence_s / block_s))
+        self.reset()
+
+    def reset(self):
+        self._floor: float | None = None
+        self._in_speech = False
+        self._speech_blocks = 0
+        self._silence_blocks = 0
+        self._fired = False
+
+    def update(self, rms: float) -> bool:
+        """Feed one block's RMS (int16 units). True exactly once, at the endpoint."""
+        if self._fired:
+            return False
+
+        floor = self._floor
+        if floor is None:
+            floor = rms
+        elif rms < floor:
+            floor += self.FLOOR_FALL * (rms - floor)
+        else:
+            floor += self.FLOOR_RISE * (rms - floor)
+        self._floor = floor
+
+        ratio = self.RELEASE_RATIO if self._in_speech else self.SPEECH_RATIO
+        self._in_speech = rms > max(floor * ratio, self.MIN_LEVEL)
+
+        if self._in_speech:
+            self._speech_blocks += 1
+            self._silence_blocks = 0
+            return False
+
+        self._silence_blocks += 1
+        if self._speech_blocks >= self._min_speech and self._silence_blocks >= self._max_silence:
+            self._fired = True
+            return True
+        return False
@@ -1,12 +1,16 @@
 import threading
+import time
 
 import numpy as np
 import sounddevice as sd
 from PySide6.QtCore import QObject, Signal
 
+from sesyaz.audio.endpointer import Endpointer
+
 
 class AudioRecorder(QObject):
     audio_level = Signal(float)  # 0.0-1.0 RMS, emitted each audio block
+    speech_ended = Signal()      # trailing silence after speech (auto-stop mode)
 
     SAMPLE_RATE = 16000
     CHANNELS = 1
@@ -19,6 +23,11 @@ class AudioRecorder(QObject):
         self._stream: sd.InputStream | None = None
         self._lock = threading.Lock()
         self._paused = False
+        self._endpointer: Endpointer | None = None
+        self._callback_timer = None  # profiling.capture.CallbackTimer while profiling
+
+    def enable_auto_stop(self, trailing_silence_s: float):
+        self._endpointer = Endpointer(self.BLOCKSIZE / self.SAMPLE_RATE, trailing_silence_s)
 
     def start(self) -> str | None:
         """Start recording. Returns error string or None on success."""
@@ -41,19 +50,36 @@ class AudioRecorder(QObject):
         self.audio_level.emit(0.0)
 
     def resume(self):
+        if self._endpointer:
+            self._endpointer.reset()
         self._paused = False
 
     def is_paused(self) -> bool:
         return self._paused
 
+    def set_callback_timer(self, timer):
+        self._callback_timer = timer
+
+    def buffer_stats(self) -> tuple[int, int]:
+        """(blocks, bytes) currently held in the recording buffer."""
+        with self._lock:
+            return len(self._frames), sum(f.nbytes for f in self._frames)
+
     def _callback(self, indata: np.ndarray, frames: int, time_info, status):
         # AUDIO THREAD — only Signal.emit() is safe here
         if self._paused:
             return
+        timer = self._callback_timer
+        if timer is not None:
+            start = time.perf_counter()
         with self._lock:
             self._frames.append(indata.copy())
-        rms = float(np.sqrt(np.mean(indata.astype(np.float32) ** 2))) / 32768.0
-        self.audio_level.emit(min(rms * 10.0, 1.0))
+        rms = float(np.sqrt(np.mean(indata.astype(np.float32) ** 2)))
+        self.audio_level.emit(min(rms / 32768.0 * 10.0, 1.0))
+        if self._endpointer and self._endpointer.update(rms):
+            self.speech_ended.emit()
+        if timer is not None:
+            timer.add(start, time.perf_counter())
 
     def stop(self) -> np.ndarray | None:
         if self._stream:
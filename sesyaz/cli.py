@@ -0,0 +1,174 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# Subcommands handled here; anything else (or no arguments) starts the overlay.
+COMMANDS = {"history", "cache", "serve", "profile"}
+# Bearer token clients must send when `sesyaz serve` listens beyond loopback
+GATEWAY_TOKEN_ENV = "SESYAZ_GATEWAY_TOKEN"
+
+
+def _cmd_history_search(args) -> int:
+    from sesyaz.history.history_store import HistoryStore
+
+    store = HistoryStore()
+    try:
+        t0 = time.perf_counter()
+        entries = store.search(" ".join(args.query), limit=args.limit)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        store.close()
+
+    for entry in entries:
+        stamp = datetime.fromtimestamp(entry.created_at).strftime("%Y-%m-%d %H:%M")
+        text = " ".join(entry.text.split())  # one line per entry
+        print(f"{stamp}  {entry.model:<24} {text}")
+    print(f"{len(entries)} result(s) in {elapsed_ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def _transcript_cache(config=None):
+    from sesyaz.config.config_manager import ConfigManager
+    from sesyaz.transcription.cache import TranscriptionCache
+
+    cache_mb = float((config or ConfigManager()).get("cache_max_mb", 8))
+    return TranscriptionCache(max_bytes=int(cache_mb * 1024 * 1024))
+
+
+def _cmd_cache_stats(args) -> int:
+    stats = _transcript_cache().stats()
+    lookups = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / lookups if lookups else 0.0
+    print(f"entries   {stats['entries']}")
+    print(f"size      {stats['bytes'] / 1024:.1f} KiB / {stats['max_bytes'] / 1024:.0f} KiB")
+    print(f"hits      {stats['hits']}")
+    print(f"misses    {stats['misses']}")
+    print(f"hit rate  {hit_rate:.1%}")
+    return 0
+
+
+def _cmd_cache_clear(args) -> int:
+    _transcript_cache().clear()
+    return 0
+
+
+def _cmd_serve(args) -> int:
+    from sesyaz.config.config_manager import ConfigManager
+    from sesyaz.config.keyring_manager import KeyringManager
+    from sesyaz.gateway.server import TranscriptionGateway
+
+    api_key = KeyringManager.get_key()
+    if not api_key:
+        print("No API key in the keyring — run sesyaz once to set it up.", file=sys.stderr)
+        return 1
+    config = ConfigManager()
+    try:
+        gateway = TranscriptionGateway(
+            api_key,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            max_depth=args.max_queue,
+            max_per_client=args.max_per_client,
+            timeout=args.timeout,
+            default_model=config.get("model", "gpt-4o-mini-transcribe"),
+            latency_target=float(config.get("latency_target", 5.0)),
+            cache=_transcript_cache(config) if float(config.get("cache_max_mb", 8)) > 0 else None,
+            max_connections=args.max_connections,
+            token=os.environ.get(GATEWAY_TOKEN_ENV),
+        )
+    except ValueError as e:
+        print(f"{e}; set {GATEWAY_TOKEN_ENV} to require a bearer token.", file=sys.stderr)
+        return 1
+    host, port = gateway.address
+    print(f"Listening on http://{host}:{port}/v1/audio/transcriptions", file=sys.stderr)
+    try:
+        gateway.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_profile(args) -> int:
+    from sesyaz.profiling.capture import request_profile, running_pid
+
+    pid = args.pid or running_pid()
+    if pid is None:
+        print("No running sesyaz process found.", file=sys.stderr)
+        return 1
+    try:
+        output_dir = request_profile(pid, args.seconds)
+    except OSError as e:
+        print(f"Cannot signal process {pid}: {e}", file=sys.stderr)
+        return 1
+    print(f"Profiling pid {pid} for {args.seconds:g} s…", file=sys.stderr)
+    if args.no_wait:
+        print(output_dir)
+        return 0
+
+    # The target writes summary.json last; it may also exit before the end
+    deadline = time.monotonic() + args.seconds + 10.0
+    summary = output_dir / "summary.json"
+    while time.monotonic() < deadline:
+        if summary.exists():
+            print(output_dir)
+            return 0
+        time.sleep(0.2)
+    print(f"No profile written to {output_dir}", file=sys.stderr)
+    return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sesyaz", description="Voice dictation for Linux.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    history = sub.add_parser("history", help="transcript history")
+    history_sub = history.add_subparsers(dest="history_command", required=True)
+
+    search = history_sub.add_parser("search", help="full-text search past transcripts")
+    search.add_argument("query", nargs="*", help="search terms (empty = most recent)")
+    search.add_argument("-n", "--limit", type=int, default=20, help="max results")
+    search.set_defaults(func=_cmd_history_search)
+
+    cache = sub.add_parser("cache", help="transcript cache")
+    cache_sub = cache.add_subparsers(dest="cache_command", required=True)
+    cache_sub.add_parser("stats", help="show hit/miss counters and size").set_defaults(
+        func=_cmd_cache_stats
+    )
+    cache_sub.add_parser("clear", help="delete all cached transcripts").set_defaults(
+        func=_cmd_cache_clear
+    )
+
+    serve = sub.add_parser("serve", help="local OpenAI-compatible transcription endpoint")
+    serve.add_argument("--host", default="127.0.0.1",
+                       help=f"non-loopback addresses need {GATEWAY_TOKEN_ENV} set")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", type=int, default=4, help="concurrent upstream requests")
+    serve.add_argument("--max-queue", type=int, default=32, help="max queued requests")
+    serve.add_argument("--max-per-client", type=int, default=8,
+                       help="max queued requests per client")
+    serve.add_argument("--timeout", type=float, default=120.0,
+                       help="default and maximum per-request deadline, seconds")
+    serve.add_argument("--max-connections", type=int, default=64,
+                       help="connections handled at once; more get 503")
+    serve.set_defaults(func=_cmd_serve)
+
+    profile = sub.add_parser("profile", help="profile the running sesyaz process")
+    profile.add_argument("--seconds", type=float, default=10.0, help="capture length")
+    profile.add_argument("--pid", type=int, default=None, help="target process (default: pid file)")
+    profile.add_argument("--no-wait", action="store_true",
+                         help="print the output directory without waiting for it")
+    profile.set_defaults(func=_cmd_profile)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        from sesyaz.app import main as run_app
+        return run_app()
+    args = build_parser().parse_args(argv)
+    return args.func(args)
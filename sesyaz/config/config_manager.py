@@ -3,12 +3,19 @@ from pathlib import Path
 
 CONFIG_DIR = Path.home() / ".config" / "sesyaz"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+DATA_DIR = Path.home() / ".local" / "share" / "sesyaz"
+CACHE_DIR = Path.home() / ".cache" / "sesyaz"
 
 DEFAULTS = {
-    "model": "gpt-4o-mini-transcribe",
+    "model": "gpt-4o-mini-transcribe",  # or "auto" — pick per clip by latency_target
+    "latency_target": 5.0,       # seconds; "auto" falls back to a faster model above this
     "output_mode": "clipboard",  # "clipboard" | "paste" | "clipboard+paste"
     "language": "",              # empty = auto-detect; ISO 639-1 e.g. "tr", "en"
     "stay_open": False,          # keep overlay open after transcription for editing
+    "auto_stop": False,          # finish recording automatically after trailing silence
+    "auto_stop_silence": 1.5,    # seconds of silence after speech that end the dictation
+    "tempo_factor": 1.0,         # >1.0 speeds speech up before upload (pitch-preserving)
+    "cache_max_mb": 8,           # `sesyaz serve` transcript cache size cap; 0 disables it
     "window_x": None,            # saved drag position (None = center-bottom default)
     "window_y": None,
     "first_run": True,
@@ -0,0 +1,133 @@
+import collections
+import threading
+import time
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, client: str, payload: dict, deadline: float):
+        self.client = client
+        self.payload = payload
+        self.deadline = deadline  # time.monotonic() value
+        self.result: str | None = None
+        self.status = 0           # HTTP status once finished
+        self.error = ""
+        self.retry_after: float | None = None
+        self.cache_key: str | None = None
+        self._done = threading.Event()
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def finish(self, status: int, result: str | None = None, error: str = ""):
+        self.status = status
+        self.result = result
+        self.error = error
+        self._done.set()
+
+    def wait(self) -> bool:
+        return self._done.wait(max(0.0, self.remaining()))
+
+
+class FairQueue:
+    """Bounded job queue with round-robin scheduling across clients.
+
+    Each client has its own FIFO; get() serves clients in turn, so one tool
+    submitting a burst cannot starve the others. put() raises QueueFull once
+    the total depth or the client's own depth limit is reached.
+
+    reserve() claims a slot up front, before the request body is read, so a
+    full queue is refused without buffering the upload; the following put()
+    for that client uses the slot, or release() gives it back.
+    """
+
+    def __init__(self, max_depth: int = 32, max_per_client: int = 8):
+        self._max_depth = max_depth
+        self._max_per_client = max_per_client
+        self._queues: collections.OrderedDict[str, collections.deque[Job]] = (
+            collections.OrderedDict()
+        )
+        self._depth = 0
+        self._reserved: collections.Counter[str] = collections.Counter()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _check(self, client: str):
+        # Caller holds self._cond
+        if self._closed:
+            raise QueueFull("gateway is shutting down")
+        if self._depth + self._reserved.total() >= self._max_depth:
+            raise QueueFull("queue is full")
+        queue = self._queues.get(client)
+        if (len(queue) if queue else 0) + self._reserved.get(client, 0) >= self._max_per_client:
+            raise QueueFull("too many queued requests for this client")
+
+    def reserve(self, client: str):
+        with self._cond:
+            self._check(client)
+            self._reserved[client] += 1
+
+    def _unreserve(self, client: str) -> bool:
+        # Caller holds self._cond
+        if not self._reserved.get(client):
+            return False
+        self._reserved[client] -= 1
+        if not self._reserved[client]:
+            del self._reserved[client]
+        return True
+
+    def release(self, client: str):
+        with self._cond:
+            self._unreserve(client)
+
+    def put(self, job: Job):
+        with self._cond:
+            if self._closed:
+                raise QueueFull("gateway is shutting down")
+            if not self._unreserve(job.client):
+                self._check(job.client)
+            queue = self._queues.get(job.client)
+            if queue is None:
+                queue = self._queues[job.client] = collections.deque()
+            queue.append(job)
+            self._depth += 1
+            self._cond.notify()
+
+    def get(self) -> Job | None:
+        """Next job in round-robin order; None once the queue is closed."""
+        with self._cond:
+            while not self._depth and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+            client, queue = next(iter(self._queues.items()))
+            job = queue.popleft()
+            self._depth -= 1
+            if queue:
+                self._queues.move_to_end(client)  # back of the rotation
+            else:
+                del self._queues[client]
+            return job
+
+    def close(self) -> list[Job]:
+        """Stop serving jobs; returns the ones still waiting so they can be failed."""
+        with self._cond:
+            self._closed = True
+            pending = [job for queue in self._queues.values() for job in queue]
+            self._queues.clear()
+            self._reserved.clear()
+            self._depth = 0
+            self._cond.notify_all()
+            return pending
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "depth": self._depth,
+                "reserved": self._reserved.total(),
+                "max_depth": self._max_depth,
+                "clients": {c: len(q) for c, q in self._queues.items()},
+            }
@@ -0,0 +1,454 @@
+import hashlib
+import hmac
+import ipaddress
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import openai
+import soundfile as sf
+
+from sesyaz.audio.audio_utils import delete_temp_file
+from sesyaz.gateway.scheduler import FairQueue, Job, QueueFull
+from sesyaz.transcription.cache import TranscriptionCache
+from sesyaz.transcription.model_router import AUTO_MODEL, ModelRouter
+from sesyaz.transcription.transcribe import transcribe_file
+
+TRANSCRIPTIONS_PATH = "/v1/audio/transcriptions"
+MAX_UPLOAD = 25 * 1024 * 1024  # same limit as the OpenAI endpoint
+RESPONSE_FORMATS = ("json", "text")
+DEFAULT_RETRY_AFTER = 2.0  # seconds, when the API gives no Retry-After
+IDLE_TIMEOUT = 30.0  # seconds a connection may stall before it is dropped
+
+_REJECT_BODY = json.dumps(
+    {"error": {"message": "Too many connections", "type": "server_error"}}
+).encode()
+_REJECT = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n"
+    b"Content-Length: %d\r\n\r\n" % len(_REJECT_BODY)
+) + _REJECT_BODY
+
+
+def _parse_multipart(content_type: str,
+                     body: bytes) -> tuple[dict[str, str], dict[str, tuple[str, bytes]]]:
+    # Splits on the boundary directly: only the small part headers go through
+    # the email parser, so an upload costs one extra copy of the file at most.
+    header = EmailMessage()
+    header["Content-Type"] = content_type
+    boundary = header.get_param("boundary")
+    if header.get_content_type() != "multipart/form-data" or not boundary:
+        raise ValueError("expected multipart/form-data")
+    delimiter = b"--" + str(boundary).encode("latin-1")
+
+    fields: dict[str, str] = {}
+    files: dict[str, tuple[str, bytes]] = {}
+    pos = body.find(delimiter)
+    if pos < 0:
+        raise ValueError("malformed multipart body")
+    pos += len(delimiter)
+    while not body.startswith(b"--", pos):  # "--" after the delimiter ends the body
+        if not body.startswith(b"\r\n", pos):
+            raise ValueError("malformed multipart body")
+        pos += 2
+        end = body.find(b"\r\n" + delimiter, pos)
+        if end < 0:
+            raise ValueError("unterminated multipart body")
+        # Search from the preceding CRLF so a part with no headers is accepted
+        head_end = body.find(b"\r\n\r\n", pos - 2, end)
+        if head_end < 0:
+            raise ValueError("malformed multipart part")
+        part = BytesParser(policy=HTTP).parsebytes(body[pos:head_end + 2], headersonly=True)
+        name = part.get_param("name", header="content-disposition")
+        if name:
+            data = body[head_end + 4:end]
+            filename = part.get_filename()
+            if filename is not None:
+                files[name] = (filename, data)
+            else:
+                fields[name] = data.decode("utf-8", "replace").strip()
+        pos = end + 2 + len(delimiter)
+    return fields, files
+
+
+def _is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+class _GatewayHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with a cap on connections handled at once.
+
+    Past the cap a connection gets an immediate 503 instead of a thread, so
+    a burst of uploads cannot pile up threads and request buffers.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], handler, max_connections: int):
+        self._slots = threading.BoundedSemaphore(max_connections)
+        super().__init__(address, handler)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            try:
+                request.sendall(_REJECT)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+
+class TranscriptionGateway:
+    """Local OpenAI-compatible transcription endpoint.
+
+    Requests from all local tools share one API client (one connection pool)
+    and a bounded worker pool fed by a FairQueue. A rate-limit response from
+    the API pauses every worker until Retry-After, so the whole machine backs
+    off together; each request still gives up at its own deadline.
+    Identical re-submissions (retries, batch re-runs) are answered from the
+    TranscriptionCache without queueing or calling the API.
+
+    Every request is billed to the user's own key, so binding to anything
+    but loopback requires `token`, sent by clients as a bearer token.
+    """
+
+    def __init__(self, api_key: str, host: str = "127.0.0.1", port: int = 8765,
+                 workers: int = 4, max_depth: int = 32, max_per_client: int = 8,
+                 timeout: float = 120.0, default_model: str = "gpt-4o-mini-transcribe",
+                 latency_target: float = 5.0, cache: TranscriptionCache | None = None,
+                 max_connections: int = 64, token: str | None = None):
+        if not token and not _is_loopback(host):
+            raise ValueError(
+                f"refusing to serve on {host} without a token — anyone who can reach it "
+                "would be using your API key"
+            )
+        self.token = token or None
+        # Retries are handled here (shared cooldown), not per request in the SDK
+        self._client = openai.OpenAI(api_key=api_key, max_retries=0)
+        self._queue = FairQueue(max_depth, max_per_client)
+        self._timeout = timeout
+        self._default_model = default_model
+        self._latency_target = latency_target
+        self._cache = cache
+        self._cooldown_until = 0.0
+        self._cooldown_lock = threading.Lock()
+        self._router_lock = threading.Lock()  # workers share latency.json
+        self._workers = [
+            threading.Thread(target=self._work, name=f"sesyaz-gateway-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        self._httpd = _GatewayHTTPServer((host, port), _Handler, max_connections)
+        self._httpd.gateway = self
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._httpd.server_address[:2]
+
+    def serve_forever(self):
+        for worker in self._workers:
+            worker.start()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+            for job in self._queue.close():
+                job.finish(503, error="Gateway shutting down")
+
+    def shutdown(self):
+        self._httpd.shutdown()
+
+    # ── Scheduling ────────────────────────────────────────────────────────────
+
+    def reserve(self, client: str):
+        self._queue.reserve(client)
+
+    def release(self, client: str):
+        self._queue.release(client)
+
+    def submit(self, job: Job):
+        self._queue.put(job)
+
+    def stats(self) -> dict:
+        stats = self._queue.stats()
+        stats["workers"] = len(self._workers)
+        stats["cooldown"] = max(0.0, self._cooldown_until - time.monotonic())
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        return stats
+
+    def cache_key(self, payload: dict) -> str | None:
+        if self._cache is None:
+            return None
+        return TranscriptionCache.key(
+            payload["data"], payload["model"] or self._default_model,
+            payload["language"], payload["prompt"],
+        )
+
+    def cached(self, key: str | None) -> str | None:
+        return self._cache.get(key) if key is not None else None
+
+    def request_timeout(self, requested: str | None) -> float:
+        try:
+            value = float(requested) if requested else self._timeout
+        except ValueError:
+            value = self._timeout
+        return max(1.0, min(value, self._timeout))
+
+    def _work(self):
+        # WORKER THREAD
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._run(job)
+
+    def _run(self, job: Job):
+        while True:
+            wait = self._cooldown_until - time.monotonic()
+            if wait > 0:
+                if wait >= job.remaining():
+                    job.retry_after = wait
+                    job.finish(429, error="Rate limit exceeded")
+                    return
+                time.sleep(wait)
+            if job.remaining() <= 0:
+                job.finish(504, error="Deadline exceeded while queued")
+                return
+            try:
+                text = self._transcribe(job)
+            except openai.RateLimitError as e:
+                self._throttle(e)
+                continue  # retry after the shared cooldown if the deadline allows
+            except openai.AuthenticationError:
+                job.finish(502, error="Invalid API key configured in sesyaz")
+            except openai.APIStatusError as e:
+                job.finish(e.status_code, error=e.message)
+            except openai.APITimeoutError:
+                job.finish(504, error="Upstream timeout")
+            except openai.APIConnectionError:
+                job.finish(502, error="Connection error")
+            except Exception as e:
+                job.finish(500, error=f"Error: {e}")
+            else:
+                if job.cache_key is not None and text:
+                    self._cache.put(job.cache_key, text)
+                job.finish(200, result=text)
+            return
+
+    def _throttle(self, error: openai.RateLimitError):
+        try:
+            retry_after = float(error.response.headers.get("retry-after", DEFAULT_RETRY_AFTER))
+        except (TypeError, ValueError):
+            retry_after = DEFAULT_RETRY_AFTER
+        with self._cooldown_lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+
+    def _transcribe(self, job: Job) -> str:
+        payload = job.payload
+        suffix = os.path.splitext(payload["filename"])[1] or ".wav"
+        fd, path = tempfile.mkstemp(suffix=suffix, prefix="sesyaz_gw_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload["data"])
+            model = payload["model"] or self._default_model
+            duration = None
+            if model == AUTO_MODEL:
+                model, duration = self._route(path)
+            client = self._client.with_options(timeout=max(1.0, job.remaining()))
+            started = time.monotonic()
+            text = transcribe_file(client, path, model, payload["language"], payload["prompt"])
+            if duration is not None:
+                # Feed the router back, as the overlay does, so "auto" adapts here too
+                with self._router_lock:
+                    ModelRouter().record(model, duration, time.monotonic() - started)
+            return text
+        finally:
+            delete_temp_file(path)
+
+    def _route(self, path: str) -> tuple[str, float]:
+        """Return (model, clip duration) for an "auto" request."""
+        try:
+            duration = sf.info(path).duration
+        except RuntimeError:
+            duration = 0.0  # format libsndfile cannot read — route as a short clip
+        with self._router_lock:
+            model, _ = ModelRouter().route(duration, self._latency_target)
+        return model, duration
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "sesyaz-gateway"
+    protocol_version = "HTTP/1.1"  # keep-alive for local clients
+    timeout = IDLE_TIMEOUT  # idle keep-alive connections give their slot back
+
+    @property
+    def _gateway(self) -> TranscriptionGateway:
+        return self.server.gateway
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: dict, headers: dict | None = None):
+        self._send(status, json.dumps(data).encode(), "application/json", headers)
+
+    def _send_error(self, status: int, message: str, headers: dict | None = None):
+        if status == 429:
+            kind = "rate_limit_error"
+        elif status < 500:
+            kind = "invalid_request_error"
+        else:
+            kind = "server_error"
+        self._send_json(status, {"error": {"message": message, "type": kind}}, headers)
+
+    def _authorized(self) -> bool:
+        token = self._gateway.token
+        if token is None:
+            return True
+        expected = f"Bearer {token}".encode()
+        if hmac.compare_digest(self.headers.get("Authorization", "").encode(), expected):
+            return True
+        self.close_connection = True  # body left unread
+        self._send_error(401, "Invalid or missing gateway token")
+        return False
+
+    def _client_id(self) -> str:
+        client = self.headers.get("X-Client-Id")
+        if client:
+            return client
+        auth = self.headers.get("Authorization")
+        if auth and self._gateway.token is None:
+            # Tools keep sending their own key — use it to tell them apart
+            return "key:" + hashlib.blake2b(auth.encode(), digest_size=6).hexdigest()
+        return self.headers.get("User-Agent") or self.client_address[0]
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        if urlsplit(self.path).path == "/health":
+            self._send_json(200, self._gateway.stats())
+        else:
+            self._send_error(404, "Not found")
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        if urlsplit(self.path).path != TRANSCRIPTIONS_PATH:
+            self.close_connection = True
+            self._send_error(404, "Not found")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if length <= 0 or length > MAX_UPLOAD:
+            self.close_connection = True  # body left unread
+            self._send_error(413 if length > MAX_UPLOAD else 411, "Invalid request size")
+            return
+
+        # Claim a queue slot before buffering the upload, so a full queue
+        # costs the client a round trip and the gateway no memory
+        client = self._client_id()
+        try:
+            self._gateway.reserve(client)
+        except QueueFull as e:
+            self.close_connection = True  # body left unread
+            self._send_error(429, str(e), {"Retry-After": "1"})
+            return
+        submitted = False
+        try:
+            request = self._read_request(length)
+            if request is None:
+                return
+            payload, response_format = request
+            key = self._gateway.cache_key(payload)
+            text = self._gateway.cached(key)
+            if text is not None:
+                self._send_result(response_format, text)
+                return
+
+            timeout = self._gateway.request_timeout(self.headers.get("X-Request-Timeout"))
+            job = Job(client, payload, time.monotonic() + timeout)
+            job.cache_key = key
+            try:
+                self._gateway.submit(job)
+            except QueueFull as e:
+                self._send_error(429, str(e), {"Retry-After": "1"})
+                return
+            submitted = True
+        finally:
+            if not submitted:
+                self._gateway.release(client)
+
+        if not job.wait():
+            self._send_error(504, "Deadline exceeded")
+            return
+        if job.status != 200:
+            headers = {}
+            if job.retry_after is not None:
+                headers["Retry-After"] = str(max(1, round(job.retry_after)))
+            self._send_error(job.status, job.error, headers)
+            return
+        self._send_result(response_format, job.result)
+
+    def _read_request(self, length: int) -> tuple[dict, str] | None:
+        """Read and validate the upload; None once an error has been sent."""
+        body = self.rfile.read(length)
+        try:
+            fields, files = _parse_multipart(self.headers.get("Content-Type", ""), body)
+        except ValueError as e:
+            self._send_error(400, str(e))
+            return None
+        if "file" not in files:
+            self._send_error(400, "Missing 'file' field")
+            return None
+        response_format = fields.get("response_format", "json")
+        if response_format not in RESPONSE_FORMATS:
+            self._send_error(400, f"Unsupported response_format: {response_format}")
+            return None
+
+        filename, data = files["file"]
+        payload = {
+            "filename": filename,
+            "data": data,
+            "model": fields.get("model", ""),
+            "language": fields.get("language", ""),
+            "prompt": fields.get("prompt", ""),
+        }
+        return payload, response_format
+
+    def _send_result(self, response_format: str, text: str):
+        if response_format == "text":
+            self._send(200, text.encode(), "text/plain; charset=utf-8")
+        else:
+            self._send_json(200, {"text": text})
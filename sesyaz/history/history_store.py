@@ -0,0 +1,187 @@
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from sesyaz.config.config_manager import DATA_DIR
+
+HISTORY_DB = DATA_DIR / "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id         INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    text       TEXT NOT NULL,
+    model      TEXT NOT NULL DEFAULT '',
+    language   TEXT NOT NULL DEFAULT '',
+    duration   REAL,
+    latency    REAL,
+    route      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS transcripts_created_at ON transcripts(created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+    text,
+    content='transcripts',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO transcripts_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+"""
+
+_INSERT = (
+    "INSERT INTO transcripts (created_at, text, model, language, duration, latency, route)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_COLUMNS = "t.id, t.created_at, t.text, t.model, t.language, t.duration, t.latency, t.route"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    id: int
+    created_at: float  # unix timestamp
+    text: str
+    model: str
+    language: str
+    duration: float | None  # seconds of recorded audio
+    latency: float | None   # seconds from confirm to transcript
+    route: str              # model routing decision ("auto" mode), else empty
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5.0)
+    # WAL lets the search panel / CLI read while the writer thread commits
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    if "route" not in _columns(conn):  # databases created before model routing
+        # The overlay's writer and reader, or a CLI run, may open the same old
+        # database at once: take the write lock, then re-check under it
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if "route" not in _columns(conn):
+                conn.execute("ALTER TABLE transcripts ADD COLUMN route TEXT NOT NULL DEFAULT ''")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+    return conn
+
+
+def _columns(conn: sqlite3.Connection) -> set[str]:
+    return {row[1] for row in conn.execute("PRAGMA table_info(transcripts)")}
+
+
+def _fts_query(query: str) -> str:
+    # Quote every term so FTS5 syntax in user input is matched literally;
+    # the trailing * turns each term into a prefix match (search-as-you-type).
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in query.split())
+
+
+class HistoryStore:
+    """Transcript history in SQLite with an FTS5 full-text index.
+
+    add() only enqueues; a background thread commits queued entries in
+    batches, so recording history never adds latency to the paste path.
+    """
+
+    BATCH_SIZE = 64
+
+    def __init__(self, path: Path = HISTORY_DB):
+        self._path = path
+        self._reader: sqlite3.Connection | None = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+
+    def add(self, text: str, model: str = "", language: str = "",
+            duration: float | None = None, latency: float | None = None,
+            route: str = ""):
+        self._queue.put((time.time(), text, model, language, duration, latency, route))
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="sesyaz-history", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self):
+        # WRITER THREAD — owns its own connection
+        try:
+            conn = _connect(self._path)
+        except sqlite3.Error:
+            return  # history is best-effort; never break dictation over it
+        try:
+            stop = False
+            while not stop:
+                item = self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                try:
+                    with conn:
+                        conn.executemany(_INSERT, batch)
+                except sqlite3.Error:
+                    pass
+        finally:
+            conn.close()
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._reader is None:
+            self._reader = _connect(self._path)
+        return self._reader
+
+    def search(self, query: str, limit: int = 50) -> list[HistoryEntry]:
+        """Best matches first; an empty query returns the most recent entries."""
+        match = _fts_query(query)
+        if not match:
+            return self.recent(limit)
+        rows = self._conn().execute(
+            f"SELECT {_COLUMNS} FROM transcripts_fts"
+            " JOIN transcripts t ON t.id = transcripts_fts.rowid"
+            " WHERE transcripts_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit),
+        ).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def recent(self, limit: int = 50) -> list[HistoryEntry]:
+        rows = self._conn().execute(
+            f"SELECT {_COLUMNS} FROM transcripts t ORDER BY t.created_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+
+    def close(self):
+        """Flush queued writes and close all connections."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
@@ -1,3 +1,4 @@
+import time
 from enum import Enum
 
 from PySide6.QtCore import Qt, QTimer, Slot
@@ -10,12 +11,15 @@ from PySide6.QtWidgets import (
 from sesyaz.audio.audio_utils import (
     SILENCE_THRESHOLD,
     compute_rms,
-    save_temp_wav,
 )
 from sesyaz.audio.recorder import AudioRecorder
 from sesyaz.config.config_manager import ConfigManager
 from sesyaz.config.keyring_manager import KeyringManager
+from sesyaz.history.history_store import HistoryStore
 from sesyaz.output.output_handler import OutputHandler
+from sesyaz.postprocess.replacer import PostProcessor
+from sesyaz.profiling.signal_hook import ProfileSignalHook
+from sesyaz.transcription.model_router import AUTO_MODEL, ModelRouter
 from sesyaz.transcription.openai_client import TranscriptionWorker
 from sesyaz.waveform_widget import WaveformWidget
 
@@ -31,6 +35,7 @@ class State(Enum):
 MODELS = [
     ("gpt-4o-mini-transcribe", "mini  ⚡"),
     ("gpt-4o-transcribe",      "gpt-4o  ✦"),
+    (AUTO_MODEL,               "auto  ◎"),
 ]
 
 BAR_H  = 92   # compact bar height
@@ -42,11 +47,23 @@ class VoiceBarWindow(QWidget):
         super().__init__()
         self._config = config
         self._worker: TranscriptionWorker | None = None
+        self._state = State.LISTENING
         self._recorder = AudioRecorder(self)
         self._elapsed = 0
         self._model_idx = self._load_model_idx()
         self._drag_pos = None
 
+        # Transcript history — writes are flushed on a background thread
+        self._history = HistoryStore()
+        self._session: dict = {}
+        QApplication.instance().aboutToQuit.connect(self._history.close)
+
+        # User dictionary — compiled in the background while recording
+        self._postprocessor = PostProcessor()
+
+        # `sesyaz profile` / SIGUSR1 — idle until a capture is requested
+        self._profile_hook = ProfileSignalHook(self._recorder, self)
+
         self._setup_window()
         self._build_ui()
         self._connect_signals()
@@ -130,6 +147,8 @@ class VoiceBarWindow(QWidget):
         )
         settings_action = menu.addAction("⚙  Ayarlar")
         settings_action.triggered.connect(self._open_settings)
+        history_action = menu.addAction("🔍  Geçmişte ara")
+        history_action.triggered.connect(self._open_history)
         menu.exec(event.globalPos())
 
     # ── UI layout ─────────────────────────────────────────────────────────────
@@ -234,12 +253,15 @@ class VoiceBarWindow(QWidget):
         self._btn_confirm.clicked.connect(self._on_confirm)
         self._btn_cancel.clicked.connect(self._on_cancel)
         self._recorder.audio_level.connect(self._waveform.push_level)
+        self._recorder.speech_ended.connect(self._on_speech_ended)
         QShortcut(QKeySequence(Qt.Key.Key_Escape), self).activated.connect(self._on_cancel)
         QShortcut(QKeySequence(Qt.Key.Key_Space), self).activated.connect(self._on_pause_toggle)
+        QShortcut(QKeySequence("Ctrl+F"), self).activated.connect(self._open_history)
 
     # ── State control ─────────────────────────────────────────────────────────
 
     def _set_state(self, state: State):
+        self._state = state
         is_active = state in (State.LISTENING, State.PAUSED)
         is_result = state == State.RESULT
 
@@ -289,19 +311,63 @@ class VoiceBarWindow(QWidget):
 
     # ── Settings ──────────────────────────────────────────────────────────────
 
+    def _exec_paused(self, dlg):
+        # Pause dictation while a modal dialog is open, so auto-stop cannot
+        # transcribe and quit from inside its event loop; resume afterwards
+        # unless the dialog ended the recording (e.g. a history pick)
+        resume = self._state == State.LISTENING
+        if resume:
+            self._on_pause_toggle()
+        dlg.exec()
+        if resume and self._state == State.PAUSED and self._recorder.is_recording():
+            self._on_pause_toggle()
+
     def _open_settings(self):
         from sesyaz.ui.settings_dialog import SettingsDialog
         dlg = SettingsDialog(self._config, self)
-        dlg.exec()
+        self._exec_paused(dlg)
         # Reload model index in case it changed
         self._model_idx = self._load_model_idx()
         self._btn_model.setText(MODELS[self._model_idx][1])
 
+    # ── History ───────────────────────────────────────────────────────────────
+
+    def _open_history(self):
+        # A transcription in flight delivers and quits on its own — don't race it
+        if self._state in (State.PROCESSING, State.ERROR):
+            return
+        from sesyaz.ui.history_panel import HistoryPanel
+        dlg = HistoryPanel(self._history, self)
+        dlg.selected.connect(self._on_history_selected)
+        dlg.activateWindow()
+        self._exec_paused(dlg)
+
+    @Slot(str)
+    def _on_history_selected(self, text: str):
+        # Re-use a past transcript: drop the current recording and output it
+        if self._state in (State.PROCESSING, State.ERROR):
+            return
+        self._rec_timer.stop()
+        self._recorder.stop()
+        self._deliver(text)
+
+    def _record_history(self, text: str):
+        self._history.add(
+            text,
+            model=self._session.get("model", ""),
+            language=self._session.get("language", ""),
+            duration=self._session.get("duration"),
+            latency=self._session.get("latency"),
+            route=self._session.get("route", ""),
+        )
+
     # ── Actions ───────────────────────────────────────────────────────────────
 
     def start_recording(self):
         self._set_state(State.LISTENING)
         self._fade_timer.start()
+        if self._config.get("auto_stop", False):
+            self._recorder.enable_auto_stop(float(self._config.get("auto_stop_silence", 1.5)))
         err = self._recorder.start()
         if err:
             self._show_error(err)
@@ -325,14 +391,8 @@ class VoiceBarWindow(QWidget):
         if self._result_edit.isVisible():
             text = self._result_edit.toPlainText().strip()
             if text:
-                OutputHandler.copy_to_clipboard(text)
-                mode = self._config.get("output_mode", "clipboard")
-                self.hide()
-                if mode in ("paste", "clipboard+paste"):
-                    QTimer.singleShot(150, OutputHandler.xdotool_paste)
-                    QTimer.singleShot(300, QApplication.instance().quit)
-                else:
-                    QTimer.singleShot(50, QApplication.instance().quit)
+                self._record_history(text)
+                self._deliver(text)
             else:
                 QTimer.singleShot(50, QApplication.instance().quit)
             return
@@ -347,17 +407,39 @@ class VoiceBarWindow(QWidget):
         self._set_state(State.PROCESSING)
         self._status.setText("Transkribe ediliyor…")
 
-        path = save_temp_wav(audio, AudioRecorder.SAMPLE_RATE)
         api_key = KeyringManager.get_key()
         model = self._config.get("model", "gpt-4o-mini-transcribe")
         language = self._config.get("language", "")
-
-        self._worker = TranscriptionWorker(path, model, api_key, language, parent=self)
+        duration = len(audio) / AudioRecorder.SAMPLE_RATE
+        route = ""
+        if model == AUTO_MODEL:
+            target = float(self._config.get("latency_target", 5.0))
+            model, route = ModelRouter().route(duration, target)
+        tempo = float(self._config.get("tempo_factor", 1.0))
+
+        self._session = {
+            "model": model,
+            "language": language,
+            "duration": duration,
+            "route": route,
+            "started": time.monotonic(),
+        }
+
+        self._worker = TranscriptionWorker(
+            audio, AudioRecorder.SAMPLE_RATE, model, api_key, language, tempo,
+            parent=self,
+        )
         self._worker.done.connect(self._on_done)
         self._worker.error.connect(self._on_error)
         self._worker.finished.connect(self._worker.deleteLater)
         self._worker.start()
 
+    @Slot()
+    def _on_speech_ended(self):
+        # Auto-stop endpoint — behaves like clicking ✔ while listening
+        if self._recorder.is_recording() and not self._recorder.is_paused():
+            self._on_confirm()
+
     @Slot()
     def _on_cancel(self):
         self._rec_timer.stop()
@@ -366,8 +448,10 @@ class VoiceBarWindow(QWidget):
 
     @Slot(str)
     def _on_done(self, text: str):
+        # Measured before post-processing: the router learns API latency only
+        self._session["latency"] = time.monotonic() - self._session["started"]
+        text = self._postprocessor.apply(text)
         stay_open = self._config.get("stay_open", False)
-        mode = self._config.get("output_mode", "clipboard")
 
         if stay_open:
             # Show editable result — user reviews/edits, then clicks ✔
@@ -379,11 +463,22 @@ class VoiceBarWindow(QWidget):
             self.activateWindow()
         else:
             # Immediate copy + close
-            OutputHandler.copy_to_clipboard(text)
-            self.hide()
-            if mode in ("paste", "clipboard+paste"):
-                QTimer.singleShot(150, OutputHandler.xdotool_paste)
+            self._record_history(text)
+            self._deliver(text)
+
+        ModelRouter().record(
+            self._session["model"], self._session["duration"], self._session["latency"]
+        )
+
+    def _deliver(self, text: str):
+        OutputHandler.copy_to_clipboard(text)
+        mode = self._config.get("output_mode", "clipboard")
+        self.hide()
+        if mode in ("paste", "clipboard+paste"):
+            QTimer.singleShot(150, OutputHandler.xdotool_paste)
             QTimer.singleShot(300, QApplication.instance().quit)
+        else:
+            QTimer.singleShot(50, QApplication.instance().quit)
 
     @Slot(str)
     def _on_error(self, msg: str):
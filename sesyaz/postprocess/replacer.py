@@ -0,0 +1,218 @@
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+
+from sesyaz.config.config_manager import CACHE_DIR, CONFIG_DIR
+
+DICTIONARY_FILE = CONFIG_DIR / "dictionary.json"  # {"from": "to", ...}
+AUTOMATON_CACHE = CACHE_DIR / "dictionary.marshal"
+_CACHE_VERSION = 2
+
+
+def _fold(ch: str) -> str:
+    # Case-insensitive matching, one char in → one char out so match offsets
+    # stay valid (e.g. "İ".lower() is two code points; keep it as-is).
+    low = ch.lower()
+    return low if len(low) == 1 else ch
+
+
+class Replacer:
+    """Aho-Corasick matcher for a replacement / expansion dictionary.
+
+    Matching is case-insensitive, respects word boundaries and picks the
+    leftmost-longest non-overlapping matches in a single pass over the text,
+    independent of dictionary size.
+    """
+
+    def __init__(self, entries: dict[str, str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._lengths: list[int] = []
+        self._values: list[str] = []
+        self._bounds: list[tuple[bool, bool]] = []  # (check start, check end)
+
+        for source, value in entries.items():
+            if not source:
+                continue
+            self._add(source, value)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # The automaton is plain lists, dicts and strings, so it is cached with
+    # marshal: loading it never runs code, unlike pickle.
+
+    def _state(self) -> tuple:
+        return (self._goto, self._fail, self._out, self._lengths, self._values, self._bounds)
+
+    @classmethod
+    def _from_state(cls, state) -> "Replacer":
+        goto, fail, out, lengths, values, bounds = state
+        if not all(isinstance(x, list) for x in (goto, fail, out, lengths, values, bounds)):
+            raise ValueError("not a dictionary automaton")
+        if not (len(goto) == len(fail) == len(out) and len(lengths) == len(values) == len(bounds)):
+            raise ValueError("inconsistent dictionary automaton")
+        replacer = cls.__new__(cls)
+        (replacer._goto, replacer._fail, replacer._out,
+         replacer._lengths, replacer._values, replacer._bounds) = state
+        return replacer
+
+    def _add(self, source: str, value: str):
+        goto = self._goto
+        state = 0
+        for ch in source:
+            ch = _fold(ch)
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][ch] = nxt
+                goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        if self._out[state]:
+            # Same key in a different case — the later entry wins
+            self._values[self._out[state][0]] = value
+            return
+        idx = len(self._values)
+        self._out[state] = (idx,)
+        self._lengths.append(len(source))
+        self._values.append(value)
+        self._bounds.append((source[0].isalnum(), source[-1].isalnum()))
+
+    def _link(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())  # depth-1 states fail to the root
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def apply(self, text: str) -> str:
+        n = len(text)
+        if not self._values or not n:
+            return text
+
+        goto, fail, out = self._goto, self._fail, self._out
+        lengths, bounds = self._lengths, self._bounds
+        best_end = [0] * n   # longest accepted match starting at each index
+        best_idx = [0] * n
+        found = False
+
+        state = 0
+        for i, ch in enumerate(text):
+            ch = _fold(ch)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                start = i - lengths[idx] + 1
+                check_start, check_end = bounds[idx]
+                if check_start and start > 0 and text[start - 1].isalnum():
+                    continue
+                if check_end and i + 1 < n and text[i + 1].isalnum():
+                    continue
+                if i + 1 > best_end[start]:
+                    best_end[start] = i + 1
+                    best_idx[start] = idx
+                    found = True
+
+        if not found:
+            return text
+
+        parts: list[str] = []
+        pos = 0
+        i = 0
+        while i < n:
+            end = best_end[i]
+            if end:
+                value = self._values[best_idx[i]]
+                # "btw" → "by the way", but "Btw" at a sentence start → "By the way"
+                if value and text[i].isupper() and value[0].islower():
+                    value = value[0].upper() + value[1:]
+                parts.append(text[pos:i])
+                parts.append(value)
+                pos = i = end
+            else:
+                i += 1
+        parts.append(text[pos:])
+        return "".join(parts)
+
+
+def load_replacer(path: Path = DICTIONARY_FILE,
+                  cache_path: Path = AUTOMATON_CACHE) -> Replacer | None:
+    """Return the compiled dictionary, rebuilding the on-disk cache if stale."""
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    try:
+        # loads() on the whole file: marshal.load() reads a file in small chunks
+        version, cached_digest, state = marshal.loads(cache_path.read_bytes())
+        if version == _CACHE_VERSION and cached_digest == digest:
+            return Replacer._from_state(state)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # missing, stale or corrupt cache — rebuild it below
+
+    try:
+        entries = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(entries, dict):
+        return None
+    replacer = Replacer({str(k): str(v) for k, v in entries.items()})
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=".dictionary_")
+    except OSError:
+        return replacer
+    try:
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump((_CACHE_VERSION, digest, replacer._state()), f)
+        os.replace(tmp, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return replacer
+
+
+class PostProcessor:
+    """Applies the user dictionary to transcripts.
+
+    The dictionary is loaded on a background thread at startup, while the
+    user is still speaking; apply() only waits if loading is not done yet.
+    """
+
+    def __init__(self, path: Path = DICTIONARY_FILE):
+        self._path = path
+        self._replacer: Replacer | None = None
+        self._thread = threading.Thread(
+            target=self._load, name="sesyaz-dictionary", daemon=True
+        )
+        self._thread.start()
+
+    def _load(self):
+        self._replacer = load_replacer(self._path)
+
+    def apply(self, text: str) -> str:
+        self._thread.join()
+        if self._replacer is None:
+            return text
+        return self._replacer.apply(text)
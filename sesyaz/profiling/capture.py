@@ -0,0 +1,271 @@
+import collections
+import cProfile
+import fcntl
+import io
+import json
+import os
+import platform
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from sesyaz.config.config_manager import DATA_DIR
+
+PROFILE_DIR = DATA_DIR / "profiles"
+PID_FILE = DATA_DIR / "sesyaz.pid"
+REQUEST_FILE = DATA_DIR / "profile_request.json"
+PROFILE_SIGNAL = signal.SIGUSR1
+DEFAULT_SECONDS = 10.0
+
+
+class CallbackTimer:
+    """Log2 histograms of audio callback run time and call interval (µs).
+
+    add() is O(1) and allocation-free; it runs on the audio thread.
+    """
+
+    BUCKETS = 32  # bucket i holds values in [2**(i-1), 2**i) µs
+
+    def __init__(self):
+        self.durations = [0] * self.BUCKETS
+        self.intervals = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._last_start: float | None = None
+
+    def add(self, start: float, end: float):
+        elapsed = end - start
+        self.durations[min(int(elapsed * 1e6).bit_length(), self.BUCKETS - 1)] += 1
+        if self._last_start is not None:
+            gap = int((start - self._last_start) * 1e6)
+            self.intervals[min(gap.bit_length(), self.BUCKETS - 1)] += 1
+        self._last_start = start
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @staticmethod
+    def _format(title: str, buckets: list[int]) -> list[str]:
+        lines = [title]
+        total = sum(buckets) or 1
+        peak = max(buckets) or 1
+        for i, n in enumerate(buckets):
+            if not n:
+                continue
+            low = 0 if i == 0 else 1 << (i - 1)
+            bar = "#" * max(1, round(40 * n / peak))
+            lines.append(f"  {low:>9} – {(1 << i) - 1:>9} µs  {n:>7}  {n / total:6.1%}  {bar}")
+        return lines
+
+    def report(self, block_s: float) -> str:
+        mean = self.total / self.count if self.count else 0.0
+        lines = [
+            f"callbacks        {self.count}",
+            f"mean run time    {mean * 1e6:.1f} µs",
+            f"max run time     {self.max * 1e6:.1f} µs",
+            f"block period     {block_s * 1e6:.0f} µs",
+            "",
+        ]
+        lines += self._format("run time per callback", self.durations)
+        lines.append("")
+        lines += self._format("interval between callbacks", self.intervals)
+        return "\n".join(lines) + "\n"
+
+
+class StackSampler(threading.Thread):
+    """Statistical profiler: samples every thread's Python stack periodically.
+
+    Output is in collapsed-stack format ("thread;frame;frame count"), ready
+    for flamegraph.pl / speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        super().__init__(name="sesyaz-sampler", daemon=True)
+        self._interval = interval
+        self._halt = threading.Event()
+        self.stacks: collections.Counter[str] = collections.Counter()
+        self.samples = 0
+
+    def run(self):
+        own = threading.get_ident()
+        while not self._halt.wait(self._interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                parts = []
+                while frame is not None:
+                    code = frame.f_code
+                    filename = os.path.basename(code.co_filename)
+                    parts.append(f"{code.co_name} ({filename}:{frame.f_lineno})")
+                    frame = frame.f_back
+                parts.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(parts))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+    def report(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+class ProfileCapture:
+    """One profiling run, written to its own timestamped directory.
+
+    Collects cProfile stats for the thread that calls start()/stop() (the
+    GUI thread), stack samples of all threads, and tracemalloc allocations
+    made while the capture is running.
+    """
+
+    def __init__(self, seconds: float, output_dir: Path | None = None):
+        self.seconds = seconds
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.output_dir = output_dir or PROFILE_DIR / stamp
+        self.callback_timer = CallbackTimer()
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler()
+        self._started_tracemalloc = False
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(16)
+            self._started_tracemalloc = True
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self, extra_reports: dict[str, str] | None = None) -> Path:
+        self._profile.disable()
+        self._sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        out = self.output_dir
+        out.mkdir(parents=True, exist_ok=True)
+
+        self._profile.dump_stats(out / "cprofile.pstats")
+        buf = io.StringIO()
+        pstats.Stats(self._profile, stream=buf).sort_stats("cumulative").print_stats(60)
+        (out / "cprofile.txt").write_text(buf.getvalue())
+
+        (out / "stacks.txt").write_text(self._sampler.report())
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+        ])
+        lines = ["Top allocations made during the capture (by line)", ""]
+        lines += [str(stat) for stat in snapshot.statistics("lineno")[:40]]
+        (out / "tracemalloc.txt").write_text("\n".join(lines) + "\n")
+
+        for name, text in (extra_reports or {}).items():
+            (out / name).write_text(text)
+
+        # Written last — its presence marks a complete capture
+        (out / "summary.json").write_text(json.dumps({
+            "pid": os.getpid(),
+            "started": datetime.fromtimestamp(self._started).isoformat(timespec="seconds"),
+            "seconds": round(time.time() - self._started, 3),
+            "samples": self._sampler.samples,
+            "audio_callbacks": self.callback_timer.count,
+            "python": platform.python_version(),
+        }, indent=2))
+        return out
+
+
+# ── Requesting a capture from another process (sesyaz profile) ───────────────
+
+# The overlay holds an exclusive flock on the pid file for its whole lifetime;
+# the kernel drops it when the process dies, so an unlocked file is stale even
+# if a crash left it behind and the pid has since been reused.
+_pid_file_fd: int | None = None
+
+
+def write_pid_file():
+    global _pid_file_fd
+    try:
+        PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(PID_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)  # another overlay is running and owns the file
+        return
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _pid_file_fd = fd
+
+
+def remove_pid_file():
+    global _pid_file_fd
+    if _pid_file_fd is None:
+        return
+    try:
+        PID_FILE.unlink()
+    except OSError:
+        pass
+    os.close(_pid_file_fd)  # releases the lock
+    _pid_file_fd = None
+
+
+def is_sesyaz(pid: int) -> bool:
+    try:
+        cmdline = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return False
+    return b"sesyaz" in cmdline
+
+
+def running_pid() -> int | None:
+    try:
+        fd = os.open(PID_FILE, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            pid = int(os.read(fd, 32).decode().strip())
+        else:
+            return None  # nobody holds the lock — left over from a crash
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+    return pid if is_sesyaz(pid) else None
+
+
+def request_profile(pid: int, seconds: float) -> Path:
+    """Ask a running sesyaz to profile itself; returns the output directory."""
+    if not is_sesyaz(pid):
+        # SIGUSR1 terminates processes that don't handle it
+        raise ProcessLookupError(f"process {pid} is not sesyaz")
+    output_dir = PROFILE_DIR / datetime.now().strftime("%Y%m%d-%H%M%S")
+    REQUEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    REQUEST_FILE.write_text(json.dumps({"seconds": seconds, "output_dir": str(output_dir)}))
+    os.kill(pid, PROFILE_SIGNAL)
+    return output_dir
+
+
+def take_request() -> tuple[float, Path | None]:
+    """Read and consume a pending request; defaults when signalled by hand."""
+    try:
+        request = json.loads(REQUEST_FILE.read_text())
+        REQUEST_FILE.unlink()
+    except (OSError, json.JSONDecodeError):
+        return DEFAULT_SECONDS, None
+    output_dir = request.get("output_dir")
+    return float(request.get("seconds", DEFAULT_SECONDS)), Path(output_dir) if output_dir else None
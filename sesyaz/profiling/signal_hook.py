@@ -0,0 +1,87 @@
+import collections
+import signal
+import socket
+
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer
+from PySide6.QtWidgets import QApplication
+
+from sesyaz.audio.recorder import AudioRecorder
+from sesyaz.profiling.capture import (
+    PROFILE_SIGNAL,
+    ProfileCapture,
+    remove_pid_file,
+    take_request,
+    write_pid_file,
+)
+
+
+class ProfileSignalHook(QObject):
+    """Starts a ProfileCapture when the process receives SIGUSR1.
+
+    The signal is delivered through a wakeup socket watched by the Qt event
+    loop, so nothing polls and nothing runs until a capture is requested.
+    """
+
+    def __init__(self, recorder: AudioRecorder, parent=None):
+        super().__init__(parent)
+        self._recorder = recorder
+        self._capture: ProfileCapture | None = None
+
+        self._rsock, self._wsock = socket.socketpair()
+        self._rsock.setblocking(False)
+        self._wsock.setblocking(False)
+        signal.set_wakeup_fd(self._wsock.fileno())
+        # A Python-level handler is required to replace the default action
+        # (terminate); the real work happens in _on_wakeup on the GUI thread.
+        signal.signal(PROFILE_SIGNAL, lambda signum, frame: None)
+
+        self._notifier = QSocketNotifier(self._rsock.fileno(), QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._on_wakeup)
+
+        write_pid_file()
+        QApplication.instance().aboutToQuit.connect(self._on_quit)
+
+    def _on_wakeup(self):
+        try:
+            data = self._rsock.recv(64)
+        except OSError:
+            return
+        if PROFILE_SIGNAL in data and self._capture is None:
+            self._start(*take_request())
+
+    def _start(self, seconds, output_dir):
+        self._capture = ProfileCapture(seconds, output_dir)
+        self._capture.start()
+        self._recorder.set_callback_timer(self._capture.callback_timer)
+        QTimer.singleShot(int(seconds * 1000), self._stop)
+
+    def _stop(self):
+        capture, self._capture = self._capture, None
+        if capture is None:
+            return
+        self._recorder.set_callback_timer(None)
+        block_s = AudioRecorder.BLOCKSIZE / AudioRecorder.SAMPLE_RATE
+        capture.stop({
+            "callback_timing.txt": capture.callback_timer.report(block_s),
+            "objects.txt": self._object_report(),
+        })
+
+    def _object_report(self) -> str:
+        frames, nbytes = self._recorder.buffer_stats()
+        lines = [
+            f"recorder buffer   {frames} blocks, {nbytes / 1024:.1f} KiB",
+            "",
+            "Live Qt objects by class",
+        ]
+        counts: collections.Counter[str] = collections.Counter()
+        for widget in QApplication.topLevelWidgets():
+            counts[type(widget).__name__] += 1
+            for child in widget.findChildren(QObject):
+                counts[type(child).__name__] += 1
+        lines += [f"  {n:>6}  {name}" for name, n in counts.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def _on_quit(self):
+        self._stop()  # flush a capture cut short by the app closing
+        signal.set_wakeup_fd(-1)
+        remove_pid_file()
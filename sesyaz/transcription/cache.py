@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from sesyaz.config.config_manager import CACHE_DIR
+
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / "transcripts"
+_STATS_FILE = "stats.json"
+_SUFFIX = ".txt"
+
+
+class TranscriptionCache:
+    """Content-addressed transcript cache on disk with size-bounded LRU eviction.
+
+    Entries are plain text files named after a hash of the uploaded audio and
+    the request parameters; a file's mtime is its last use, so eviction
+    removes the least recently used entries first. Hit/miss counters are
+    persisted next to the entries so `sesyaz cache stats` can report them.
+    """
+
+    def __init__(self, directory: Path = TRANSCRIPT_CACHE_DIR, max_bytes: int = 8 << 20):
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(audio: bytes, model: str, language: str = "", prompt: str = "") -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(audio)
+        h.update(f"\0{model}\0{language}\0{prompt}".encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)  # mark as recently used
+        except OSError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return text
+
+    def put(self, key: str, text: str):
+        if self._write(self._path(key), text):
+            self._evict()
+
+    def _write(self, path: Path, text: str) -> bool:
+        # Atomic replace: other processes read entries and stats unlocked
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._dir, prefix=".entry_")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def _entries(self) -> list[os.DirEntry]:
+        try:
+            return [e for e in os.scandir(self._dir) if e.name.endswith(_SUFFIX)]
+        except OSError:
+            return []
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+        if total <= self._max_bytes:
+            return
+        entries.sort()  # oldest use first
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+    # ── Counters ──────────────────────────────────────────────────────────────
+
+    def _count(self, field: str):
+        with self._lock:
+            stats = self._read_stats()
+            stats[field] = stats.get(field, 0) + 1
+            self._write(self._dir / _STATS_FILE, json.dumps(stats))
+
+    def _read_stats(self) -> dict:
+        try:
+            return json.loads((self._dir / _STATS_FILE).read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def stats(self) -> dict:
+        stats = self._read_stats()
+        entries = self._entries()
+        size = 0
+        for entry in entries:
+            try:
+                size += entry.stat().st_size
+            except OSError:
+                pass
+        return {
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+            "entries": len(entries),
+            "bytes": size,
+            "max_bytes": self._max_bytes,
+        }
+
+    def clear(self):
+        for entry in self._entries():
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+        try:
+            (self._dir / _STATS_FILE).unlink()
+        except OSError:
+            pass
@@ -0,0 +1,94 @@
+import bisect
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from sesyaz.config.config_manager import DATA_DIR
+
+AUTO_MODEL = "auto"
+# Best quality first; each later model is a faster fallback
+ROUTE_MODELS = ["gpt-4o-transcribe", "gpt-4o-mini-transcribe"]
+BUCKETS = (10, 30, 60, 120)  # clip length bucket upper bounds, seconds
+
+LATENCY_FILE = DATA_DIR / "latency.json"
+
+
+def duration_bucket(duration: float) -> int:
+    return bisect.bisect_left(BUCKETS, duration)
+
+
+class ModelRouter:
+    """Picks a model for the "auto" mode from observed latencies.
+
+    Keeps an exponential moving average of latency per model and clip-length
+    bucket. A model with no samples in a bucket is tried, and a model that
+    was skipped for being slow is re-probed every PROBE_EVERY routes in that
+    bucket, so one slow result cannot rule it out for good.
+    """
+
+    EMA_WEIGHT = 0.3
+    PROBE_EVERY = 5
+
+    def __init__(self, path: Path = LATENCY_FILE):
+        self._path = path
+        try:
+            self._stats: dict = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self._stats = {}
+
+    def estimate(self, model: str, duration: float) -> float | None:
+        stats = self._stats.get(model)
+        if not stats:
+            return None
+        return stats.get("buckets", {}).get(str(duration_bucket(duration)))
+
+    def route(self, duration: float, target: float) -> tuple[str, str]:
+        """Return (model, reason) for a clip of `duration` seconds."""
+        model, reason = self._pick(duration, target)
+        self._save()  # skip counters only survive across dictations on disk
+        return model, reason
+
+    def _pick(self, duration: float, target: float) -> tuple[str, str]:
+        key = str(duration_bucket(duration))
+        estimates = {m: self.estimate(m, duration) for m in ROUTE_MODELS}
+        for model in ROUTE_MODELS:
+            est = estimates[model]
+            if est is None:
+                return model, f"auto → {model} (no latency data yet)"
+            if est <= target:
+                return model, f"auto → {model} (~{est:.1f}s ≤ {target:g}s)"
+            skips = self._stats[model].setdefault("skips", {})
+            skips[key] = skips.get(key, 0) + 1
+            if skips[key] >= self.PROBE_EVERY:
+                skips[key] = 0
+                return model, f"auto → {model} (re-probe, ~{est:.1f}s last seen)"
+        # Nothing is expected to meet the target — take the fastest
+        model = min(ROUTE_MODELS, key=lambda m: estimates[m])
+        return model, f"auto → {model} (~{estimates[model]:.1f}s, target {target:g}s missed)"
+
+    def record(self, model: str, duration: float, latency: float):
+        stats = self._stats.setdefault(model, {"buckets": {}})
+        buckets = stats.setdefault("buckets", {})
+        key = str(duration_bucket(duration))
+        w = self.EMA_WEIGHT
+        prev = buckets.get(key)
+        buckets[key] = latency if prev is None else prev + w * (latency - prev)
+        self._save()
+
+    def _save(self):
+        # Atomic replace: the overlay and `sesyaz serve` may read it mid-write
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=".latency_")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._stats, f, indent=2)
+            os.replace(tmp, self._path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -1,31 +1,34 @@
+import numpy as np
 import openai
 from PySide6.QtCore import QThread, Signal
 
-from sesyaz.audio.audio_utils import delete_temp_file
+from sesyaz.audio.audio_utils import delete_temp_file, save_temp_wav
+from sesyaz.audio.tempo import compress_tempo
+from sesyaz.transcription.transcribe import transcribe_file
 
 
 class TranscriptionWorker(QThread):
     done = Signal(str)
     error = Signal(str)
 
-    def __init__(self, audio_path: str, model: str, api_key: str,
-                 language: str = "", parent=None):
+    def __init__(self, audio: np.ndarray, sample_rate: int, model: str, api_key: str,
+                 language: str = "", tempo: float = 1.0, parent=None):
         super().__init__(parent)
-        self._audio_path = audio_path
+        self._audio = audio
+        self._sample_rate = sample_rate
         self._model = model
         self._api_key = api_key
         self._language = language
+        self._tempo = tempo
 
     def run(self):
+        audio_path = None
         try:
+            # Encoding (and optional tempo compression) stays off the GUI thread
+            audio = compress_tempo(self._audio, self._sample_rate, self._tempo)
+            audio_path = save_temp_wav(audio, self._sample_rate)
             client = openai.OpenAI(api_key=self._api_key)
-            kwargs: dict = dict(model=self._model, file=None, response_format="text")
-            if self._language:
-                kwargs["language"] = self._language
-            with open(self._audio_path, "rb") as f:
-                kwargs["file"] = f
-                response = client.audio.transcriptions.create(**kwargs)
-            text = response.strip() if isinstance(response, str) else response.text.strip()
+            text = transcribe_file(client, audio_path, self._model, self._language)
             if not text:
                 self.error.emit("No speech detected")
             else:
@@ -39,4 +42,5 @@ class TranscriptionWorker(QThread):
         except Exception as e:
             self.error.emit(f"Error: {e}")
         finally:
-            delete_temp_file(self._audio_path)
+            if audio_path:
+                delete_temp_file(audio_path)
@@ -0,0 +1,18 @@
+import openai
+
+
+def transcribe_file(client: openai.OpenAI, audio_path: str, model: str,
+                    language: str = "", prompt: str = "") -> str:
+    """Upload one audio file and return the plain-text transcript.
+
+    Kept free of Qt so the gateway and the benchmarks can use it headless.
+    """
+    kwargs: dict = dict(model=model, file=None, response_format="text")
+    if language:
+        kwargs["language"] = language
+    if prompt:
+        kwargs["prompt"] = prompt
+    with open(audio_path, "rb") as f:
+        kwargs["file"] = f
+        response = client.audio.transcriptions.create(**kwargs)
+    return response.strip() if isinstance(response, str) else response.text.strip()
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtWidgets import (
+    QDialog, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout,
+)
+
+from sesyaz.history.history_store import HistoryStore
+
+RESULT_LIMIT = 30
+
+
+class HistoryPanel(QDialog):
+    """Quick-search over past transcripts; Enter / double-click picks one."""
+
+    selected = Signal(str)
+
+    def __init__(self, store: HistoryStore, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self.setWindowTitle("Sesyaz — Geçmiş")
+        self.setMinimumSize(480, 320)
+        self.setModal(True)
+        self.setStyleSheet(
+            "QDialog { background: #1c1c1e; }"
+            "QLineEdit { background: #2c2c2e; color: #ebebf5; border: 1px solid #48484a;"
+            " border-radius: 8px; padding: 6px 8px; font-size: 13px; }"
+            "QListWidget { background: #1c1c1e; color: #ebebf5; border: none; font-size: 12px; }"
+            "QListWidget::item { padding: 6px 4px; border-bottom: 1px solid #2c2c2e; }"
+            "QListWidget::item:selected { background: #3a3a3c; }"
+        )
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        layout.setContentsMargins(12, 12, 12, 12)
+
+        self._query = QLineEdit()
+        self._query.setPlaceholderText("Geçmişte ara…")
+        layout.addWidget(self._query)
+
+        self._results = QListWidget()
+        self._results.setWordWrap(True)
+        layout.addWidget(self._results)
+
+        # Debounce keystrokes — each query is a single FTS lookup
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(60)
+        self._debounce.timeout.connect(self._refresh)
+
+        self._query.textChanged.connect(self._debounce.start)
+        self._query.returnPressed.connect(self._pick_current)
+        self._results.itemActivated.connect(self._pick)
+        QShortcut(QKeySequence(Qt.Key.Key_Down), self._query).activated.connect(
+            self._results.setFocus
+        )
+
+        self._refresh()
+
+    def _refresh(self):
+        self._results.clear()
+        for entry in self._store.search(self._query.text(), limit=RESULT_LIMIT):
+            stamp = datetime.fromtimestamp(entry.created_at).strftime("%d.%m %H:%M")
+            item = QListWidgetItem(f"{stamp}   {entry.text}")
+            item.setData(Qt.ItemDataRole.UserRole, entry.text)
+            self._results.addItem(item)
+        if self._results.count():
+            self._results.setCurrentRow(0)
+
+    def _pick_current(self):
+        item = self._results.currentItem()
+        if item is not None:
+            self._pick(item)
+
+    def _pick(self, item: QListWidgetItem):
+        self.selected.emit(item.data(Qt.ItemDataRole.UserRole))
+        self.accept()
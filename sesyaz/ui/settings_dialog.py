@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import (
-    QCheckBox, QComboBox, QDialog, QDialogButtonBox,
+    QCheckBox, QComboBox, QDialog, QDialogButtonBox, QDoubleSpinBox,
     QFormLayout, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QGroupBox,
 )
@@ -43,19 +43,60 @@ class SettingsDialog(QDialog):
         self._model_combo = QComboBox()
         self._model_combo.addItem("gpt-4o-mini-transcribe  (hızlı, ekonomik)", "gpt-4o-mini-transcribe")
         self._model_combo.addItem("gpt-4o-transcribe  (en iyi kalite)", "gpt-4o-transcribe")
+        self._model_combo.addItem("otomatik  (gecikme hedefine göre)", "auto")
         current_model = config.get("model", "gpt-4o-mini-transcribe")
-        self._model_combo.setCurrentIndex(
-            0 if current_model == "gpt-4o-mini-transcribe" else 1
-        )
+        self._model_combo.setCurrentIndex(max(0, self._model_combo.findData(current_model)))
         tx_form.addRow("Model:", self._model_combo)
 
+        self._latency_target = QDoubleSpinBox()
+        self._latency_target.setRange(1.0, 60.0)
+        self._latency_target.setSingleStep(0.5)
+        self._latency_target.setSuffix(" sn")
+        self._latency_target.setValue(float(config.get("latency_target", 5.0)))
+        self._latency_target.setEnabled(self._model_combo.currentData() == "auto")
+        self._model_combo.currentIndexChanged.connect(
+            lambda: self._latency_target.setEnabled(self._model_combo.currentData() == "auto")
+        )
+        tx_form.addRow("Gecikme hedefi:", self._latency_target)
+
         self._lang_input = QLineEdit()
         self._lang_input.setPlaceholderText("otomatik algıla  (veya: tr, en, de, fr…)")
         self._lang_input.setText(config.get("language", ""))
         tx_form.addRow("Dil:", self._lang_input)
 
+        self._tempo_combo = QComboBox()
+        self._tempo_combo.addItem("Kapalı", 1.0)
+        for factor in (1.15, 1.25, 1.35, 1.5):
+            self._tempo_combo.addItem(f"{factor:g}×  (daha kısa yükleme)", factor)
+        current_tempo = float(config.get("tempo_factor", 1.0))
+        tempo_idx = self._tempo_combo.findData(current_tempo)
+        if tempo_idx < 0:  # hand-edited value in config.json
+            self._tempo_combo.addItem(f"{current_tempo:g}×", current_tempo)
+            tempo_idx = self._tempo_combo.count() - 1
+        self._tempo_combo.setCurrentIndex(tempo_idx)
+        tx_form.addRow("Ses hızlandırma:", self._tempo_combo)
+
         root.addWidget(tx_group)
 
+        # ── Kayıt ─────────────────────────────────────────────────────────────
+        rec_group = QGroupBox("Kayıt")
+        rec_form = QFormLayout(rec_group)
+
+        self._auto_stop = QCheckBox("Konuşma bitince otomatik transkribe et")
+        self._auto_stop.setChecked(bool(config.get("auto_stop", False)))
+        rec_form.addRow("", self._auto_stop)
+
+        self._auto_stop_silence = QDoubleSpinBox()
+        self._auto_stop_silence.setRange(0.5, 10.0)
+        self._auto_stop_silence.setSingleStep(0.25)
+        self._auto_stop_silence.setSuffix(" sn")
+        self._auto_stop_silence.setValue(float(config.get("auto_stop_silence", 1.5)))
+        self._auto_stop_silence.setEnabled(self._auto_stop.isChecked())
+        self._auto_stop.toggled.connect(self._auto_stop_silence.setEnabled)
+        rec_form.addRow("Sessizlik süresi:", self._auto_stop_silence)
+
+        root.addWidget(rec_group)
+
         # ── Çıktı ─────────────────────────────────────────────────────────────
         out_group = QGroupBox("Çıktı")
         out_form = QFormLayout(out_group)
@@ -101,7 +142,11 @@ class SettingsDialog(QDialog):
             KeyringManager.set_key(new_key)
 
         self._config.set("model",       self._model_combo.currentData())
+        self._config.set("latency_target", self._latency_target.value())
         self._config.set("language",    self._lang_input.text().strip())
+        self._config.set("tempo_factor", self._tempo_combo.currentData())
         self._config.set("output_mode", self._output_combo.currentData())
         self._config.set("stay_open",   self._stay_open.isChecked())
+        self._config.set("auto_stop",   self._auto_stop.isChecked())
+        self._config.set("auto_stop_silence", self._auto_stop_silence.value())
         self.accept()